@@ -5,6 +5,10 @@ This module centralizes all API endpoints, versions, and common configuration
 values to reduce duplication and improve maintainability.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # Notion API Configuration
 NOTION_API_VERSION = "2022-06-28"
 NOTION_BASE_URL = "https://api.notion.com/v1"
@@ -31,23 +35,31 @@ def get_notion_headers(api_key: str) -> dict[str, str]:
     }
 
 
-def get_notion_internal_headers(user_id: str) -> dict[str, str]:
-    """Get headers for internal Notion API requests with security headers."""
-    return {
-        "x-notion-active-user-header": user_id,
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Referer": "https://www.notion.so/",
-        # Security headers
-        "X-Requested-With": "XMLHttpRequest",
-        "Origin": "https://www.notion.so",
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-origin",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
+@lru_cache(maxsize=32)
+def get_notion_internal_headers(user_id: str) -> Mapping[str, str]:
+    """
+    Get headers for internal Notion API requests with security headers.
+
+    Results are cached per user ID and returned read-only, so callers share
+    one mapping and must copy it before modifying.
+    """
+    return MappingProxyType(
+        {
+            "x-notion-active-user-header": user_id,
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            "Referer": "https://www.notion.so/",
+            # Security headers
+            "X-Requested-With": "XMLHttpRequest",
+            "Origin": "https://www.notion.so",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-origin",
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Cache-Control": "no-cache",
+            "Pragma": "no-cache",
+        }
+    )
 
 
 # Default Configuration Values
@@ -1,5 +1,9 @@
+from types import MappingProxyType
 from typing import Any
 
+# Read-only default for missing nested properties
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 class SumCalculator:
     """
@@ -13,9 +17,16 @@ class SumCalculator:
     def calculate_total_for_column(
         rows: list[dict[str, Any]], column_name: str
     ) -> float:
-        def extract_number(item: dict[str, Any]) -> Any:
-            return item["properties"].get(column_name, {}).get("number")
-
-        numbers = map(extract_number, rows)
-        filtered_numbers = filter(lambda x: x is not None, numbers)
-        return int(sum(filtered_numbers))
+        # One generator pass; the walrus avoids walking the nested dicts twice
+        return int(
+            sum(
+                number
+                for row in rows
+                if isinstance(
+                    number := row.get("properties", _EMPTY)
+                    .get(column_name, _EMPTY)
+                    .get("number"),
+                    int | float,
+                )
+            )
+        )
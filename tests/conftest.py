@@ -1,13 +1,84 @@
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Final
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
+from notion_task_runner.logging import configure_logging
+from notion_task_runner.notion.async_notion_client import AsyncNotionClient
 from notion_task_runner.tasks.pas.sum_calculator import SumCalculator
+from notion_task_runner.tasks.task_config import TaskConfig
+
+pytest_plugins = ["tests.fixtures.cli_fixtures"]
 
 # Test constants
-TEST_API_KEY = "secret_api_key_123456789"
-TEST_SPACE_ID = "space_id_123456789"
-TEST_DATABASE_ID = "database_id_123456789"
+TEST_API_KEY: Final[str] = "secret_api_key_123456789"
+TEST_SPACE_ID: Final[str] = "space_id_123456789"
+TEST_DATABASE_ID: Final[str] = "database_id_123456789"
+
+
+def pytest_configure(config):
+  # Configure logging once per session so caplog sees task log records
+  configure_logging(json_logs=False, log_level="DEBUG")
+
+
+def pytest_addoption(parser):
+  parser.addoption("--run-slow", action="store_true", default=False, help="run tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+  # Run every async test on the session loop instead of building one per test
+  session_loop = pytest.mark.asyncio(loop_scope="session")
+  skip_slow = None if config.getoption("--run-slow") else pytest.mark.skip(reason="needs --run-slow")
+  for item in items:
+    if pytest_asyncio.is_async_test(item):
+      item.add_marker(session_loop, append=False)
+    if skip_slow and "slow" in item.keywords:
+      item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+  # Run the shared session loop on uvloop; it's a dev dependency everywhere but Windows
+  if sys.platform == "win32":
+    return asyncio.DefaultEventLoopPolicy()
+  import uvloop
+  return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _keep_session_loop():
+  # asyncio.run() in sync tests (e.g. the CLI run command) unsets the current
+  # loop on exit; put the shared session loop back for the async tests after it
+  loop = asyncio.get_running_loop()
+  yield
+  asyncio.set_event_loop(loop)
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_singleton():
+  # Tests share one loop, so don't let a client built by one test leak into the next
+  AsyncNotionClient._instance = None
+  AsyncNotionClient._initialized = False
+
+
+@pytest.fixture(autouse=True)
+def _no_dotenv(monkeypatch):
+  # Tests configure TaskConfig through the environment; don't stat or parse a local .env
+  monkeypatch.setitem(TaskConfig.model_config, "env_file", None)
+
+
+@pytest.fixture(autouse=True)
+def _caplog_levels(caplog):
+  # Keep stray asyncio debug records out of caplog, then capture INFO and up for every test.
+  # set_level also sets the capture handler's level, so the root call has to come last.
+  caplog.set_level(logging.WARNING, logger="asyncio")
+  caplog.set_level(logging.INFO)
 
 # ========================
 # Calculator Fixtures
@@ -36,25 +107,26 @@ def mock_calculator_30():
 # Notion Client Fixtures
 # ========================
 
+# Shared "200 OK" response; tests that need a failure swap raise_for_status via monkeypatch
+_OK_RESPONSE = MagicMock()
+_OK_RESPONSE.status_code = 200
+_OK_RESPONSE.status = 200
+_OK_RESPONSE.text = AsyncMock(return_value="OK")
+_OK_RESPONSE.raise_for_status = MagicMock(return_value=None)  # Don't use AsyncMock for this
+
+
 @pytest.fixture
 def mock_notion_client_200():
   client = MagicMock()
-
-  # Create a mock response with proper methods
-  mock_response = MagicMock()
-  mock_response.status_code = 200
-  mock_response.status = 200
-  mock_response.text = AsyncMock(return_value="OK")
-  mock_response.raise_for_status = MagicMock(return_value=None)  # Don't use AsyncMock for this
-
-  client.patch = AsyncMock(return_value=mock_response)
+  client.patch = AsyncMock(return_value=_OK_RESPONSE)
   client.post = AsyncMock()
   return client
 
 
 @pytest.fixture
 def mock_notion_client_400():
-  import aiohttp
+  # Imported here since test_helpers itself imports constants from this module
+  from tests.test_helpers import client_response_error
   client = MagicMock()
 
   # Create a mock response that raises ClientResponseError on raise_for_status()
@@ -63,14 +135,7 @@ def mock_notion_client_400():
   mock_response.status = 400
   mock_response.text = AsyncMock(return_value="Bad Request")
   # Use regular MagicMock for raise_for_status, not AsyncMock
-  def raise_for_status():
-    raise aiohttp.ClientResponseError(
-      request_info=MagicMock(),
-      history=(),
-      status=400,
-      message="Bad Request"
-    )
-  mock_response.raise_for_status = raise_for_status
+  mock_response.raise_for_status = MagicMock(side_effect=client_response_error(400, "Bad Request"))
 
   client.patch = AsyncMock(return_value=mock_response)
   # Return a dict with error status for post calls to database
@@ -78,17 +143,20 @@ def mock_notion_client_400():
   return client
 
 
-@pytest.fixture
-def mock_client_single_page():
-    mock = MagicMock()
-    mock.post = AsyncMock(return_value={
-        "results": [{"id": "1"}, {"id": "2"}],
-        "has_more": False
-    })
-    return mock
+# Read-only response clients are built once per module; the public fixtures
+# only clear the recorded calls so assert_called_once() still holds per test.
+@pytest.fixture(scope="module")
+def _single_page_client():
+  client = MagicMock()
+  client.post = AsyncMock(return_value={
+    "results": [{"id": "1"}, {"id": "2"}],
+    "has_more": False
+  })
+  return client
 
-@pytest.fixture
-def mock_client_empty_response():
+
+@pytest.fixture(scope="module")
+def _empty_response_client():
   client = MagicMock()
   client.post = AsyncMock(return_value={
     "results": [],
@@ -97,8 +165,28 @@ def mock_client_empty_response():
   return client
 
 
+@pytest.fixture(scope="module")
+def _malformed_response_client():
+  client = MagicMock()
+  client.post = AsyncMock(return_value={})  # Missing 'results' and 'next_cursor'
+  return client
+
+
+@pytest.fixture
+def mock_client_single_page(_single_page_client):
+  _single_page_client.post.reset_mock()
+  return _single_page_client
+
+
+@pytest.fixture
+def mock_client_empty_response(_empty_response_client):
+  _empty_response_client.post.reset_mock()
+  return _empty_response_client
+
+
 @pytest.fixture
 def mock_client_paginated():
+  # Function-scoped: the side_effect iterator is consumed by each test
   client = MagicMock()
   client.post = AsyncMock(side_effect=[
     {"results": [{"id": "1"}], "next_cursor": "cursor-1"},
@@ -108,23 +196,26 @@ def mock_client_paginated():
 
 
 @pytest.fixture
-def mock_client_malformed_response():
-  client = MagicMock()
-  client.post = AsyncMock(return_value={})  # Missing 'results' and 'next_cursor'
-  return client
+def mock_client_malformed_response(_malformed_response_client):
+  _malformed_response_client.post.reset_mock()
+  return _malformed_response_client
 
 
 # ========================
 # Database Fixtures
 # ========================
 
+@pytest.fixture(scope="session")
+def mock_db_rows_factory():
+  # Rows are a pure function of their arguments, so every test shares the cached tuples
+  from tests.test_helpers import create_mock_database_rows
+  return create_mock_database_rows
+
+
 @pytest.fixture
-def mock_db_w_props():
+def mock_db_w_props(mock_db_rows_factory):
   db = MagicMock()
-  db.fetch_rows = AsyncMock(return_value=[
-    {"properties": {"Slutpris": {"number": 10}}},
-    {"properties": {"Slutpris": {"number": 20}}},
-  ])
+  db.fetch_rows = AsyncMock(return_value=list(mock_db_rows_factory(2)))
   return db
 
 
@@ -148,30 +239,50 @@ def mock_post_response():
 def mock_patch_response():
     return MagicMock()
 
-@pytest.fixture
+@dataclass
+class FakeConfig:
+  """Plain TaskConfig double for code that only reads is_prod and checks connectivity."""
+
+  is_prod: bool = False
+  connected: bool = True
+
+  def validate_notion_connectivity(self) -> bool:
+    return self.connected
+
+
+@pytest.fixture(scope="session")
 def mock_config():
-    mock = MagicMock()
-    mock.from_env.return_value = mock
-    mock.notion_api_key = "some-api-key"
-    return mock
+    # Read-only stand-in for TaskConfig; page tasks only read the API key
+    return SimpleNamespace(notion_api_key="fake-key")
+
+
+@pytest.fixture(scope="session")
+def _bare_notion_client():
+  # Skips __new__/__init__ entirely, so neither the singleton nor config validation is involved
+  return object.__new__(AsyncNotionClient)
+
+
+@pytest.fixture
+def bare_notion_client(_bare_notion_client, request):
+  """Return the shared bare AsyncNotionClient with fresh per-test state.
+
+  Pass a config through indirect parametrization to override the default one.
+  """
+  from tests.test_helpers import create_mock_config
+
+  vars(_bare_notion_client).clear()
+  _bare_notion_client.config = getattr(request, "param", None) or create_mock_config()
+  _bare_notion_client._session = None
+  _bare_notion_client._connector = None
+  return _bare_notion_client
 
 
 @pytest.fixture
-def mock_async_notion_client():
-    """Create a mock AsyncNotionClient for testing."""
-    from unittest.mock import patch
-    from notion_task_runner.notion.async_notion_client import AsyncNotionClient
-
-    def _create_mock_client(config=None):
-        if config is None:
-            config = MagicMock()
-            config.notion_api_key = TEST_API_KEY
-            config.notion_space_id = TEST_SPACE_ID
-
-        with (patch.object(AsyncNotionClient, '__new__', return_value=object.__new__(AsyncNotionClient)),
-              patch.object(AsyncNotionClient, '_validate_config')):
-            client = AsyncNotionClient(config)
-            client.config = config
-            return client
-
-    return _create_mock_client
+def mock_async_notion_client(bare_notion_client):
+  """Create a mock AsyncNotionClient for testing."""
+  def _create_mock_client(config=None):
+    if config is not None:
+      bare_notion_client.config = config
+    return bare_notion_client
+
+  return _create_mock_client
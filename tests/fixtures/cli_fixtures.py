@@ -0,0 +1,91 @@
+"""CLI fixtures, registered through pytest_plugins in the root conftest."""
+from dataclasses import dataclass
+from functools import cache
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+  from typer.testing import CliRunner
+  return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def render_help(cli_runner):
+  # Each help page is rendered once per session; tests only read the result.
+  # Help goes straight through the Click command inside one isolation block,
+  # skipping the Result/exception bookkeeping of CliRunner.invoke.
+  from typer.main import get_command
+
+  from notion_task_runner.cli import app
+
+  command = get_command(app)
+
+  @cache
+  def _render(argv):
+    with cli_runner.isolation() as (stdout, _stderr, _output):
+      exit_code = command.main(list(argv), prog_name=app.info.name, standalone_mode=False)
+    return SimpleNamespace(exit_code=exit_code, stdout=stdout.getvalue().decode())
+
+  return _render
+
+
+@pytest.fixture
+def patched_container():
+  with patch("notion_task_runner.cli.ApplicationContainer") as container_class:
+    yield container_class
+
+
+@pytest.fixture
+def no_event_loop(monkeypatch):
+  # Close the coroutine instead of running it so it is never reported as un-awaited
+  monkeypatch.setattr("notion_task_runner.cli.asyncio.run", lambda coro: coro.close())
+  monkeypatch.setattr("notion_task_runner.cli.TaskRunner", MagicMock)
+
+
+@pytest.fixture(scope="session")
+def container_spec():
+  # wire() only exists on container instances, so spec against one rather than the class.
+  # Providers are lazy, so building it reads no configuration.
+  from notion_task_runner.container import ApplicationContainer
+  return ApplicationContainer()
+
+
+@pytest.fixture
+def container_factory(container_spec):
+  def _build(tasks=(), connected=True):
+    container = MagicMock(spec=container_spec)
+    container.all_tasks.return_value = list(tasks)
+    container.task_config.return_value.validate_notion_connectivity.return_value = connected
+    return container
+
+  return _build
+
+
+@dataclass(frozen=True)
+class StubContainer:
+  """Plain stand-in for ApplicationContainer exposing only what the CLI calls."""
+
+  tasks: tuple = ()
+  config: Any = None
+
+  def wire(self, modules=()):
+    pass
+
+  def all_tasks(self):
+    return list(self.tasks)
+
+  def task_config(self):
+    return self.config
+
+
+@pytest.fixture
+def ready_container(monkeypatch):
+  config = SimpleNamespace(validate_notion_connectivity=lambda: True)
+  container = StubContainer(tasks=(MagicMock(), MagicMock()), config=config)
+  monkeypatch.setattr("notion_task_runner.cli.ApplicationContainer", lambda: container)
+  return container
@@ -7,7 +7,6 @@ from notion_task_runner.notion import NotionDatabase
 from notion_task_runner.tasks.task_config import TaskConfig
 
 
-@pytest.mark.asyncio
 async def test_fetch_rows_single_page(mock_client_single_page):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -18,7 +17,6 @@ async def test_fetch_rows_single_page(mock_client_single_page):
   mock_client_single_page.post.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_fetch_rows_pagination(mock_client_paginated):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -29,7 +27,6 @@ async def test_fetch_rows_pagination(mock_client_paginated):
   assert mock_client_paginated.post.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_fetch_rows_returns_empty_list(mock_client_empty_response):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -40,7 +37,6 @@ async def test_fetch_rows_returns_empty_list(mock_client_empty_response):
   mock_client_empty_response.post.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_fetch_rows_missing_keys(mock_client_malformed_response):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -49,7 +45,6 @@ async def test_fetch_rows_missing_keys(mock_client_malformed_response):
   with pytest.raises(KeyError):
     await sut.fetch_rows("irrelevant-id")
 
-@pytest.mark.asyncio
 async def test_fetch_rows_when_no_id_provided(mock_client_malformed_response):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -58,7 +53,6 @@ async def test_fetch_rows_when_no_id_provided(mock_client_malformed_response):
   with pytest.raises(ValueError):
     await sut.fetch_rows()
 
-@pytest.mark.asyncio
 async def test_fetch_rows_when_client_returns_400(mock_notion_client_400):
   config = MagicMock(spec=TaskConfig)
   config.notion_api_key = "some-api-key"
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -14,11 +14,15 @@ def fake_path(tmp_path):
     return tmp_path / "test.zip"
 
 
-@pytest.mark.asyncio
-async def test_download_and_verify_success(tmp_path):
-    from unittest.mock import AsyncMock
+@pytest.fixture
+def client(request):
+    # Tests that stub out every client interaction opt out of the spec check
+    if request.node.get_closest_marker("no_spec"):
+        return Mock()
+    return MagicMock(spec=AsyncNotionClient)
+
 
-    client = MagicMock(spec=AsyncNotionClient)
+async def test_download_and_verify_success(client, tmp_path):
     downloader = ExportFileDownloader(client)
 
     # Mock response with iter_chunked
@@ -40,37 +44,30 @@ async def test_download_and_verify_success(tmp_path):
         assert f.read() == b'data chunk'
 
 
-@pytest.mark.asyncio
-async def test_download_and_verify_fail_download(tmp_path):
-    from unittest.mock import AsyncMock
-
-    client = MagicMock(spec=AsyncNotionClient)
+@pytest.mark.no_spec
+async def test_download_and_verify_fail_download(client):
     downloader = ExportFileDownloader(client)
 
     # Simulate failed download (None returned)
     downloader._download_file = AsyncMock(return_value=None)
 
-    path = tmp_path / "missing.zip"
+    path = MagicMock(spec=Path)
     result = await downloader.download_and_verify("http://fake.url/fail.zip", path)
 
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_download_file_exception(tmp_path):
+async def test_download_file_exception(client):
 
-    client = MagicMock(spec=AsyncNotionClient)
     downloader = ExportFileDownloader(client)
 
     client.get.side_effect = Exception("network error")
-    result = await downloader._download_file("http://fake.url/file.zip", tmp_path / "output.zip")
+    result = await downloader._download_file("http://fake.url/file.zip", MagicMock(spec=Path))
 
     assert result is None
 
-@pytest.mark.asyncio
-async def test_download_file_retries_on_failure(tmp_path: Path):
+async def test_download_file_retries_on_failure(client, tmp_path: Path):
 
-    client = MagicMock(spec=AsyncNotionClient)
     client.get.side_effect = Exception("network error")
 
     downloader = ExportFileDownloader(client, max_retries=3, retry_wait_seconds=0)
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import tenacity
@@ -9,14 +9,18 @@ from notion_task_runner.tasks.download_export.export_file_poller import (
     NoActivityError,
     StaleExportError,
 )
+from notion_task_runner.tasks.task_config import TaskConfig
+
+
+def _config() -> TaskConfig:
+    # model_construct skips env/.env loading and validation; the poller only
+    # reads the space id and token
+    return TaskConfig.model_construct(notion_space_id="test_space", notion_token_v2="test_token")
 
 
 @pytest.fixture
 def mock_config():
-    config = MagicMock()
-    config.notion_space_id = "test_space"
-    config.notion_token_v2 = "test_token"
-    return config
+    return _config()
 
 
 @pytest.fixture
@@ -29,9 +33,13 @@ def sut(mock_client, mock_config):
     return ExportFilePoller(client=mock_client, config=mock_config, max_retries=2, retry_wait_seconds=0)
 
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def sut_retries3():
+    # Module-scoped, so it owns its collaborators; tests replace client.post as needed
+    return ExportFilePoller(client=MagicMock(), config=_config(), max_retries=3, retry_wait_seconds=0)
+
+
 async def test_poll_success(sut, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "recordMap": {
             "activity": {
@@ -49,9 +57,7 @@ async def test_poll_success(sut, mock_client):
     assert url == "https://notion.so/download"
 
 
-@pytest.mark.asyncio
 async def test_poll_stale_export(sut, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "recordMap": {
             "activity": {
@@ -71,9 +77,7 @@ async def test_poll_stale_export(sut, mock_client):
     assert isinstance(exc_info.value.last_attempt.exception(), StaleExportError)
 
 
-@pytest.mark.asyncio
 async def test_poll_missing_link(sut, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "recordMap": {
             "activity": {
@@ -93,9 +97,7 @@ async def test_poll_missing_link(sut, mock_client):
     assert isinstance(exc_info.value.last_attempt.exception(), MissingExportLinkError)
 
 
-@pytest.mark.asyncio
 async def test_poll_no_activity(sut, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "recordMap": {}
     })
@@ -105,9 +107,7 @@ async def test_poll_no_activity(sut, mock_client):
 
     assert isinstance(exc_info.value.last_attempt.exception(), NoActivityError)
 
-@pytest.mark.asyncio
 async def test_poll_malformed_response(sut, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={})
 
     with pytest.raises(tenacity.RetryError) as exc_info:
@@ -116,17 +116,13 @@ async def test_poll_malformed_response(sut, mock_client):
     assert isinstance(exc_info.value.last_attempt.exception(), NoActivityError)
 
 
-@pytest.mark.asyncio
-async def test_poll_retries_on_no_activity(mock_client, mock_config):
-    from unittest.mock import AsyncMock
-    sut = ExportFilePoller(client=mock_client, config=mock_config, max_retries=3, retry_wait_seconds=0)
-
+async def test_poll_retries_on_no_activity(sut_retries3):
     # Simulate NoActivityError for each retry attempt
-    mock_client.post = AsyncMock(side_effect=[{}] * 3)  # Causes NoActivityError each time
+    sut_retries3.client.post = AsyncMock(side_effect=[{}] * 3)  # Causes NoActivityError each time
 
     with pytest.raises(tenacity.RetryError) as exc_info:
-        await sut.poll_for_download_url(export_trigger_timestamp=999)
+        await sut_retries3.poll_for_download_url(export_trigger_timestamp=999)
 
     assert isinstance(exc_info.value.last_attempt.exception(), NoActivityError)
 
-    assert mock_client.post.call_count == 3
+    assert sut_retries3.client.post.call_count == 3
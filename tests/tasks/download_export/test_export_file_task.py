@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -5,8 +6,23 @@ import pytest
 
 from notion_task_runner.tasks.download_export.export_file_task import ExportFileTask
 
+FAKE_TASK_ID = "fake-task-id"
+FAKE_DOWNLOAD_URL = "http://fake.url/export.zip"
+FAKE_FILE = Path("/tmp/notion-backup.html_2025-06-23_00-00-00.zip")
+BOOM = Exception("Boom")
 
-@pytest.fixture
+# (trigger_return, poll_return, download_return, expected)
+# An exception instance as a return value is raised as a side effect instead.
+RUN_MATRIX = [
+    (FAKE_TASK_ID, FAKE_DOWNLOAD_URL, FAKE_FILE, FAKE_FILE),  # success
+    (None, None, None, None),  # missing task id
+    (FAKE_TASK_ID, None, None, None),  # missing download url
+    (FAKE_TASK_ID, FAKE_DOWNLOAD_URL, None, None),  # download error
+    (BOOM, None, None, None),  # exception is handled gracefully
+]
+
+
+@pytest.fixture(scope="module")
 def mock_config():
     mock = MagicMock()
     mock.export_type = "html"
@@ -15,62 +31,26 @@ def mock_config():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
     return MagicMock()
 
 
-@pytest.fixture
-def export_file_task(mock_client, mock_config):
-    return ExportFileTask(client=mock_client, config=mock_config)
-
-
-@pytest.mark.asyncio
-async def test_run_success(monkeypatch, export_file_task, mock_config):
-    export_file_task.trigger.trigger_export_task = AsyncMock(return_value="fake-task-id")
-    export_file_task.poller.poll_for_download_url = AsyncMock(return_value="http://fake.url/export.zip")
-    fake_file = Path("/tmp/notion-backup.html_2025-06-23_00-00-00.zip")
-    export_file_task.downloader.download_and_verify = AsyncMock(return_value=fake_file)
-
-    result = await export_file_task.run()
-
-    assert result == fake_file
-
-
-@pytest.mark.asyncio
-async def test_run_fails_on_missing_task_id(export_file_task):
-    export_file_task.trigger.trigger_export_task = AsyncMock(return_value=None)
-
-    result = await export_file_task.run()
-
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_run_fails_on_missing_download_url(export_file_task):
-    export_file_task.trigger.trigger_export_task = AsyncMock(return_value="fake-task-id")
-    export_file_task.poller.poll_for_download_url = AsyncMock(return_value=None)
-
-    result = await export_file_task.run()
-
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_run_fails_on_download_error(export_file_task):
-    export_file_task.trigger.trigger_export_task = AsyncMock(return_value="fake-task-id")
-    export_file_task.poller.poll_for_download_url = AsyncMock(return_value="http://fake.url/export.zip")
-    export_file_task.downloader.download_and_verify = AsyncMock(return_value=None)
-
-    result = await export_file_task.run()
-
-    assert result is None
+def _async_mock(value):
+    if isinstance(value, Exception):
+        return AsyncMock(side_effect=value)
+    return AsyncMock(return_value=value)
 
 
-@pytest.mark.asyncio
-async def test_run_handles_exception_gracefully(export_file_task):
-    export_file_task.trigger.trigger_export_task = AsyncMock(side_effect=Exception("Boom"))
+async def test_run_matrix(mock_client, mock_config):
+    def mk_task(trigger_return, poll_return, download_return):
+        task = ExportFileTask(client=mock_client, config=mock_config)
+        task.trigger.trigger_export_task = _async_mock(trigger_return)
+        task.poller.poll_for_download_url = _async_mock(poll_return)
+        task.downloader.download_and_verify = _async_mock(download_return)
+        return task
 
-    result = await export_file_task.run()
+    # Scenarios are independent, so run them concurrently on a single loop
+    results = await asyncio.gather(*[mk_task(*row[:3]).run() for row in RUN_MATRIX])
 
-    assert result is None
+    assert results == [row[3] for row in RUN_MATRIX]
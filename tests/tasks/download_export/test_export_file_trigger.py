@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -27,9 +27,7 @@ def trigger(mock_client, mock_config):
     return ExportFileTrigger(client=mock_client, config=mock_config)
 
 
-@pytest.mark.asyncio
 async def test_trigger_success(trigger, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={"taskId": "abc123"})
 
     result = await trigger.trigger_export_task()
@@ -38,9 +36,7 @@ async def test_trigger_success(trigger, mock_client):
     mock_client.post.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_trigger_error_without_task_id(trigger, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "name": "SomeError",
         "message": "Something went wrong",
@@ -51,9 +47,7 @@ async def test_trigger_error_without_task_id(trigger, mock_client):
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_trigger_unauthorized_error(trigger, mock_client):
-    from unittest.mock import AsyncMock
     mock_client.post = AsyncMock(return_value={
         "name": "UnauthorizedError",
         "message": "Invalid token",
@@ -1,13 +1,30 @@
+import logging
+from unittest.mock import ANY
+
+import aiohttp
 import pytest
+from tenacity import wait_none
 
-from notion_task_runner.logging import configure_logging
+from notion_task_runner.constants import DEFAULT_MAX_RETRIES
 from notion_task_runner.tasks.pas.pas_page_task import PASPageTask
+from notion_task_runner.utils.http_client import HTTPClientMixin
+from tests.test_helpers import logged_messages
+
+# tenacity's AsyncRetrying object behind the retried request helper
+_REQUEST_RETRY = HTTPClientMixin._make_notion_request.retry
+
+_EXPECTED_URL = "https://api.notion.com/v1/blocks/dummy-page-id"
+
 
-# Configure logging for tests to work with caplog
-configure_logging(json_logs=False, log_level="DEBUG")
+def _expected_payload(total_text):
+    # Only the total is checked; the label and the timestamp element are wildcards
+    return {"callout": {"rich_text": [
+        ANY,
+        {"type": "text", "text": {"content": total_text}, "annotations": {"bold": False}},
+        ANY,
+    ]}}
 
 
-@pytest.mark.asyncio
 async def test_pas_page_task_happy_path(caplog, mock_notion_client_200, mock_db_w_props, mock_config, mock_calculator_30):
     sut = PASPageTask(
         client=mock_notion_client_200,
@@ -17,19 +34,13 @@ async def test_pas_page_task_happy_path(caplog, mock_notion_client_200, mock_db_
         block_id="dummy-page-id"
     )
 
-    with caplog.at_level("INFO"):
-        await sut.run()
+    await sut.run()
 
     mock_db_w_props.fetch_rows.assert_called_once()
     mock_calculator_30.calculate_total_for_column.assert_called_once()
-    mock_notion_client_200.patch.assert_called_once()
+    mock_notion_client_200.patch.assert_called_once_with(_EXPECTED_URL, headers=ANY, json=_expected_payload("30kr"))
+    assert any("✅ PAS Page Task completed successfully" in m for m in logged_messages(caplog, logging.INFO))
 
-    args, kwargs = mock_notion_client_200.patch.call_args
-    assert "https://api.notion.com/v1/blocks/dummy-page-id" in args
-    assert kwargs["json"]["callout"]["rich_text"][1]["text"]["content"] == "30kr"
-    assert "✅ PAS Page Task completed successfully" in caplog.text
-
-@pytest.mark.asyncio
 async def test_pas_page_task_with_empty_database(mock_notion_client_200, mock_config,  calculator, mock_db_empty_list):
     sut = PASPageTask(
         client=mock_notion_client_200,
@@ -43,17 +54,11 @@ async def test_pas_page_task_with_empty_database(mock_notion_client_200, mock_co
 
     mock_db_empty_list.fetch_rows.assert_called_once()
     calculator.calculate_total_for_column.assert_called_once_with([], "Slutpris")
-    mock_notion_client_200.patch.assert_called_once()
-
-    args, kwargs = mock_notion_client_200.patch.call_args
-    assert "https://api.notion.com/v1/blocks/dummy-page-id" in args
-    assert kwargs["json"]["callout"]["rich_text"][1]["text"]["content"] == "0kr"
+    mock_notion_client_200.patch.assert_called_once_with(_EXPECTED_URL, headers=ANY, json=_expected_payload("0kr"))
 
-@pytest.mark.asyncio
-async def test_pas_page_task_handles_client_error(caplog, mock_notion_client_400, mock_db_w_props, mock_config, mock_calculator_30):
-    # Configure the mock to properly raise an exception when raise_for_status is called
-    import aiohttp
-    mock_notion_client_400.patch.return_value.raise_for_status.side_effect = aiohttp.ClientResponseError(None, None, status=400, message="Client Error")
+async def test_pas_page_task_handles_client_error(caplog, monkeypatch, mock_notion_client_400, mock_db_w_props, mock_config, mock_calculator_30):
+    # Keep the real attempt count but skip the exponential backoff between attempts
+    monkeypatch.setattr(_REQUEST_RETRY, "wait", wait_none())
 
     sut = PASPageTask(
         client=mock_notion_client_400,
@@ -63,12 +68,13 @@ async def test_pas_page_task_handles_client_error(caplog, mock_notion_client_400
         block_id="test-page"
     )
 
-    with caplog.at_level("INFO"), pytest.raises(aiohttp.ClientResponseError):  # Direct exception from mock
+    with pytest.raises(aiohttp.ClientResponseError):  # Direct exception from mock
         await sut.run()
 
     mock_db_w_props.fetch_rows.assert_called_once()
     mock_calculator_30.calculate_total_for_column.assert_called_once_with([{'properties': {'Slutpris': {'number': 10}}}, {'properties': {'Slutpris': {'number': 20}}}], "Slutpris")
     # The retry mechanism means patch gets called 3 times (default retry attempts)
+    assert _REQUEST_RETRY.stop.max_attempt_number == DEFAULT_MAX_RETRIES == 3
     assert mock_notion_client_400.patch.call_count == 3
 
-    assert "❌ PAS Page Task failed" in caplog.text
+    assert any("❌ PAS Page Task failed" in m for m in logged_messages(caplog, logging.ERROR))
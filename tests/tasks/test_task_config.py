@@ -1,23 +1,50 @@
-import os
-from unittest.mock import patch
-
 import pytest
 from pydantic import ValidationError
 
 from notion_task_runner.tasks.task_config import DEFAULT_EXPORT_DIR, TaskConfig
 
-
-@patch.dict(os.environ, {
+REQUIRED_ENV = {
     "NOTION_SPACE_ID": "space-id",
     "NOTION_TOKEN_V2": "token-v2",
     "NOTION_API_KEY": "api-key",
     "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": '{"type": "service_account"}',
     "GOOGLE_DRIVE_ROOT_FOLDER_ID": "root-folder-id",
-})
-def test_task_config_from_env_valid(monkeypatch, tmp_path):
-    monkeypatch.setenv("DOWNLOADS_DIRECTORY_PATH", str(tmp_path))
-    monkeypatch.setenv("EXPORT_TYPE", "markdown")
-    monkeypatch.setenv("FLATTEN_EXPORT_FILE_TREE", "true")
+}
+OPTIONAL_ENV = ("DOWNLOADS_DIRECTORY_PATH", "EXPORT_TYPE", "FLATTEN_EXPORT_FILE_TREE")
+
+
+@pytest.fixture
+def base_env(monkeypatch, tmp_path):
+    # Run from tmp_path so relative download directories are created there
+    monkeypatch.chdir(tmp_path)
+    for key in OPTIONAL_ENV:
+        monkeypatch.delenv(key, raising=False)
+    for key, value in REQUIRED_ENV.items():
+        monkeypatch.setenv(key, value)
+    return tmp_path
+
+
+def _apply(monkeypatch, overrides):
+    # A value of None removes the variable instead of setting it
+    for key, value in overrides.items():
+        if value is None:
+            monkeypatch.delenv(key, raising=False)
+        else:
+            monkeypatch.setenv(key, value)
+
+
+@pytest.mark.parametrize("overrides,expected", [
+    (
+        {},
+        {"downloads_directory_path": DEFAULT_EXPORT_DIR, "export_type": "markdown", "flatten_export_file_tree": False},
+    ),
+    (
+        {"DOWNLOADS_DIRECTORY_PATH": "downloads", "EXPORT_TYPE": "html", "FLATTEN_EXPORT_FILE_TREE": "true"},
+        {"downloads_directory_path": "downloads", "export_type": "html", "flatten_export_file_tree": True},
+    ),
+], ids=["defaults", "overrides"])
+def test_task_config_from_env(base_env, monkeypatch, overrides, expected):
+    _apply(monkeypatch, overrides)
 
     config = TaskConfig.from_env()
 
@@ -26,59 +53,17 @@ def test_task_config_from_env_valid(monkeypatch, tmp_path):
     assert config.notion_api_key == "api-key"
     assert config.google_drive_root_folder_id == "root-folder-id"
     assert config.google_drive_service_account_secret_json == '{"type": "service_account"}'
-    assert config.downloads_directory_path == tmp_path.resolve()
-    assert config.export_type == "markdown"
-    assert config.flatten_export_file_tree is True
-
-
-def test_task_config_missing_required_env_vars(monkeypatch, tmp_path):
-    # Create an empty .env file to override the default one
-    env_file = tmp_path / ".env"
-    env_file.write_text("")
-
-    # Change to temp directory so it loads the empty .env file
-    monkeypatch.chdir(tmp_path)
-
-    # Explicitly remove all required environment variables
-    monkeypatch.delenv("NOTION_SPACE_ID", raising=False)
-    monkeypatch.delenv("NOTION_TOKEN_V2", raising=False)
-    monkeypatch.delenv("NOTION_API_KEY", raising=False)
-    monkeypatch.delenv("GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON", raising=False)
-    monkeypatch.delenv("GOOGLE_DRIVE_ROOT_FOLDER_ID", raising=False)
-
-    with pytest.raises(ValidationError):
-        TaskConfig()
-
+    assert config.downloads_directory_path == (base_env / expected["downloads_directory_path"]).resolve()
+    assert config.export_type == expected["export_type"]
+    assert config.flatten_export_file_tree is expected["flatten_export_file_tree"]
 
-@patch.dict(os.environ, {
-    "NOTION_SPACE_ID": "space-id",
-    "NOTION_TOKEN_V2": "token-v2",
-    "NOTION_API_KEY": "api-key",
-    "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": '{"type": "service_account"}',
-    "GOOGLE_DRIVE_ROOT_FOLDER_ID": "root-folder-id",
-})
-def test_config_download_export_task_defaults(tmp_path, monkeypatch):
-    monkeypatch.delenv("DOWNLOADS_DIRECTORY_PATH", raising=False)
-    monkeypatch.delenv("EXPORT_TYPE", raising=False)
-    monkeypatch.delenv("FLATTEN_EXPORT_FILE_TREE", raising=False)
-
-    monkeypatch.chdir(tmp_path)
 
-    config = TaskConfig()
+@pytest.mark.parametrize("overrides", [
+    {"EXPORT_TYPE": "pdf"},
+    dict.fromkeys(REQUIRED_ENV),
+], ids=["invalid_export_type", "missing_required"])
+def test_task_config_invalid_env(base_env, monkeypatch, overrides):
+    _apply(monkeypatch, overrides)
 
-    assert config.downloads_directory_path == (tmp_path / DEFAULT_EXPORT_DIR).resolve()
-    assert config.export_type == "markdown"
-    assert config.flatten_export_file_tree is False
-
-
-@patch.dict(os.environ, {
-    "NOTION_SPACE_ID": "space-id",
-    "NOTION_TOKEN_V2": "token-v2",
-    "NOTION_API_KEY": "api-key",
-    "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": '{"type": "service_account"}',
-    "GOOGLE_DRIVE_ROOT_FOLDER_ID": "root-folder-id",
-    "EXPORT_TYPE": "pdf",  # Invalid type
-})
-def test_config_download_export_task_invalid_export_type():
     with pytest.raises(ValidationError):
         TaskConfig()
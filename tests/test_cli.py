@@ -2,96 +2,61 @@
 Simplified CLI tests that focus on basic functionality without complex mocking.
 """
 import re
-from unittest.mock import MagicMock, patch
+from functools import cache
+from unittest.mock import patch
 
+import click
 import pytest
-from typer.testing import CliRunner
+from typer.main import get_command
 
 from notion_task_runner.cli import app, main, version_callback
 
+# Fail fast instead of blocking an xdist worker if a command path hangs
+pytestmark = pytest.mark.timeout(5)
+
 
 class TestCLIBasic:
     """Basic CLI tests that don't require complex mocking."""
 
-    def test_help_command(self):
-        """Test that help command works."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "Automatically manage and backup Notion pages" in result.stdout
-
-    def test_run_command_help(self):
-        """Test help for run command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["run", "--help"])
+    @pytest.mark.parametrize("argv,needle", [
+        (("--help",), "Automatically manage"),
+        (("run", "--help"), "Run all Notion tasks"),
+        (("validate", "--help"), "Validate configuration"),
+        (("health", "--help"), "Check application health"),
+        (("list-tasks", "--help"), "List all available tasks"),
+    ])
+    def test_help_output(self, render_help, argv, needle):
+        """Test that each help page renders and mentions the expected text."""
+        result = render_help(argv)
         assert result.exit_code == 0
-        assert "Run all Notion tasks" in result.stdout
-
-    def test_list_tasks_command(self):
+        assert needle in strip_ansi(result.stdout)
+
+    @pytest.mark.parametrize("command,option", [
+        (None, "--json-logs"),
+        (None, "--log-level"),
+        ("run", "--dry-run"),
+        ("run", "--task"),
+    ])
+    def test_option_registered(self, command, option):
+        """Test that the option is registered without rendering any help."""
+        assert option in _option_names(command)
+
+    def test_list_tasks_command(self, cli_runner):
         """Test the list-tasks command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["list-tasks"])
+        result = cli_runner.invoke(app, ["list-tasks"])
         assert result.exit_code == 0
         assert "Available Tasks" in result.stdout
 
-    def test_validate_command_help(self):
-        """Test help for validate command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["validate", "--help"])
-        assert result.exit_code == 0
-        assert "Validate configuration" in result.stdout
-
-    def test_health_command_help(self):
-        """Test help for health command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["health", "--help"])
-        assert result.exit_code == 0
-        assert "Check application health" in result.stdout
-
-    def test_version_option(self):
+    def test_version_option(self, cli_runner):
         """Test version option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["--version"])
+        result = cli_runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert "notion-task-runner version" in result.stdout
 
     def test_invalid_command(self):
         """Test invalid command handling."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["invalid-command"])
-        assert result.exit_code != 0
-
-
-class TestCLILoggingOptions:
-    """Test CLI logging configuration options."""
-
-    def test_json_logs_option_help(self):
-        """Test that json-logs option appears in help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "--json-logs" in strip_ansi(result.stdout)
-
-    def test_log_level_option_help(self):
-        """Test that log-level option appears in help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "--log-level" in strip_ansi(result.stdout)
-
-    def test_dry_run_option_help(self):
-        """Test that dry-run option appears in run command help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "--dry-run" in strip_ansi(result.stdout)
-
-    def test_task_filter_option_help(self):
-        """Test that task option appears in run command help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "--task" in strip_ansi(result.stdout)
+        with pytest.raises(click.exceptions.UsageError):
+            get_command(app).main(["invalid-command"], standalone_mode=False)
 
 
 class TestCLIFunctionality:
@@ -120,170 +85,113 @@ class TestCLIFunctionality:
         main(json_logs=True, log_level="DEBUG")
         mock_configure.assert_called_once_with(json_logs=True, log_level="DEBUG")
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_run_command_no_config_error(self, mock_container_class):
+    def test_run_command_no_config_error(self, patched_container, cli_runner):
         """Test run command when configuration fails."""
         # Make container initialization fail
-        mock_container_class.side_effect = Exception("Config error")
+        patched_container.side_effect = Exception("Config error")
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["run"])
+        result = cli_runner.invoke(app, ["run"])
 
         # Should handle error gracefully
         assert result.exit_code == 1
         assert "error" in result.stdout.lower() or "failed" in result.stdout.lower()
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_validate_command_success(self, mock_container_class):
+    def test_validate_command_success(self, patched_container, container_factory, cli_runner):
         """Test validate command with successful validation."""
         # Setup successful validation
-        mock_container = MagicMock()
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
+        mock_container = patched_container.return_value = container_factory()
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["validate"])
+        result = cli_runner.invoke(app, ["validate"])
 
         assert result.exit_code == 0
-        mock_config.validate_notion_connectivity.assert_called_once()
+        mock_container.task_config.return_value.validate_notion_connectivity.assert_called_once()
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_validate_command_failure(self, mock_container_class):
+    def test_validate_command_failure(self, patched_container, container_factory, cli_runner):
         """Test validate command with failed validation."""
         # Setup failed validation
-        mock_container = MagicMock()
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = False
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
+        mock_container = patched_container.return_value = container_factory(connected=False)
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["validate"])
+        result = cli_runner.invoke(app, ["validate"])
 
         assert result.exit_code == 1
-        mock_config.validate_notion_connectivity.assert_called_once()
+        mock_container.task_config.return_value.validate_notion_connectivity.assert_called_once()
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_health_command_success(self, mock_container_class):
+    def test_health_command_success(self, patched_container, container_factory, cli_runner):
         """Test health command with successful health check."""
         # Setup successful health check
-        mock_container = MagicMock()
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
+        patched_container.return_value = container_factory()
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["health"])
+        result = cli_runner.invoke(app, ["health"])
 
         # Health command may succeed or fail based on actual connectivity
         assert result.exit_code in [0, 1]
 
-    def test_run_command_with_log_level_option(self):
-        """Test run command accepts log level option."""
-        runner = CliRunner()
-        # This should not fail due to invalid arguments
-        result = runner.invoke(app, ["run", "--log-level", "DEBUG", "--dry-run"])
-        # May fail due to missing config, but shouldn't fail on argument parsing
-        assert result.exit_code in [0, 1, 2]  # Accept various error codes
+    @pytest.mark.parametrize("argv", [
+        ["--log-level", "DEBUG", "run", "--dry-run"],
+        ["--json-logs", "--log-level", "WARNING", "run", "--dry-run", "--task", "test"],
+    ])
+    def test_run_command_accepts_options(self, monkeypatch, cli_runner, argv):
+        """Test that the run command parses its options before doing any work."""
+        monkeypatch.setattr("notion_task_runner.cli.configure_logging", lambda **kwargs: None)
+        monkeypatch.setattr("notion_task_runner.cli.ApplicationContainer", _exit_before_work)
 
-    def test_run_command_with_all_options(self):
-        """Test run command with all options."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["run", "--json-logs", "--log-level", "WARNING", "--dry-run", "--task", "test"])
-        # May fail due to missing config, but shouldn't fail on argument parsing
-        assert result.exit_code in [0, 1, 2]  # Accept various error codes
+        result = cli_runner.invoke(app, argv)
+
+        assert result.exit_code == 0
 
 
 class TestCLIComprehensive:
     """Comprehensive CLI tests to improve coverage."""
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_run_command_full_execution_path(self, mock_container_class):
+    def test_run_command_full_execution_path(self, ready_container, cli_runner):
         """Test full run command execution path."""
-        # Setup successful container
-        mock_container = MagicMock()
-        mock_container.all_tasks.return_value = [MagicMock(), MagicMock()]
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["run"])
+        result = cli_runner.invoke(app, ["run"])
 
         # Should handle execution gracefully (may succeed or fail with config errors)
         assert result.exit_code in [0, 1]
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_run_command_with_task_filtering_logic(self, mock_container_class):
+    def test_run_command_with_task_filtering_logic(self, no_event_loop, patched_container, container_factory, cli_runner):
         """Test task filtering logic in run command."""
         # Create tasks with specific names
-        task1 = MagicMock()
-        task1.__class__.__name__ = "PasPageTask"
-        task2 = MagicMock()
-        task2.__class__.__name__ = "StatsTask"
-        task3 = MagicMock()
-        task3.__class__.__name__ = "ExportTask"
-
-        mock_container = MagicMock()
-        mock_container.all_tasks.return_value = [task1, task2, task3]
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
-
-        with patch('notion_task_runner.cli.TaskRunner'), patch('notion_task_runner.cli.asyncio.run'):
-            runner = CliRunner()
-            result = runner.invoke(app, ["run", "--task", "pas"])
-
-            # Should execute task filtering logic
-            assert result.exit_code in [0, 1]  # Allow for config errors
-
-    def test_dry_run_mode_output(self):
+        task1 = type("PasPageTask", (), {})()
+        task2 = type("StatsTask", (), {})()
+        task3 = type("ExportTask", (), {})()
+
+        patched_container.return_value = container_factory(tasks=[task1, task2, task3])
+
+        result = cli_runner.invoke(app, ["run", "--task", "pas"])
+
+        # Should execute task filtering logic
+        assert result.exit_code in [0, 1]  # Allow for config errors
+
+    def test_dry_run_mode_output(self, ready_container, cli_runner):
         """Test dry run mode produces appropriate output."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["run", "--dry-run"])
+        result = cli_runner.invoke(app, ["run", "--dry-run"])
 
-        # In a real environment without mocks, dry run should fail gracefully
-        # due to missing config, but should show help or error message
-        # The key is that it doesn't crash and handles the dry-run flag
-        assert result.exit_code in [0, 1]  # Allow for config errors or success
+        assert result.exit_code == 0
+        assert_contains_all(result.stdout, ["dry run mode", "execution plan"])
 
-    def test_list_tasks_detailed_output(self):
+    def test_list_tasks_detailed_output(self, cli_runner):
         """Test list-tasks command provides detailed output."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["list-tasks"])
+        result = cli_runner.invoke(app, ["list-tasks"])
 
         assert result.exit_code == 0
-        assert "Available Tasks" in result.stdout
-        # Should contain some task information
-        assert len(result.stdout) > 50  # Should have substantial output
+        assert_contains_all(result.stdout, ["Available Tasks", "PAS Page Task", "Stats Task"])
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_validate_command_with_exception(self, mock_container_class):
+    def test_validate_command_with_exception(self, patched_container, cli_runner):
         """Test validate command when container raises exception."""
-        mock_container_class.side_effect = Exception("Container init failed")
+        patched_container.side_effect = Exception("Container init failed")
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["validate"])
+        result = cli_runner.invoke(app, ["validate"])
 
         # Should handle error gracefully
         assert result.exit_code == 1
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_health_command_with_failed_connectivity(self, mock_container_class):
+    def test_health_command_with_failed_connectivity(self, patched_container, container_factory, cli_runner):
         """Test health command when connectivity check fails."""
-        mock_container = MagicMock()
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = False
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
+        patched_container.return_value = container_factory(connected=False)
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["health"])
+        result = cli_runner.invoke(app, ["health"])
 
         # Should indicate health check failure
         assert result.exit_code == 1
@@ -293,84 +201,67 @@ class TestCLIComprehensive:
         assert app.info.name == "notion-task-runner"
         assert "Automatically manage and backup Notion pages" in app.info.help
 
-    def test_global_options_in_help(self):
+    def test_global_options_in_help(self, render_help):
         """Test that global options appear in help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["--help"])
-
+        result = render_help(("--help",))
         assert result.exit_code == 0
-        help_text = strip_ansi(result.stdout)
-        assert "--version" in help_text
-        assert "--json-logs" in help_text
-        assert "--log-level" in help_text
-
-    def test_all_commands_have_help(self):
-        """Test that all commands have help documentation."""
-        runner = CliRunner()
-
-        commands = ["run", "list-tasks", "validate", "health"]
-        for cmd in commands:
-            result = runner.invoke(app, [cmd, "--help"])
-            assert result.exit_code == 0
-            assert len(result.stdout) > 10  # Should have help text
-
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_run_command_task_filter_case_insensitive(self, mock_container_class):
+        assert_contains_all(strip_ansi(result.stdout), ["--version", "--json-logs", "--log-level"])
+
+    def test_run_command_task_filter_case_insensitive(self, no_event_loop, patched_container, container_factory, cli_runner):
         """Test that task filtering is case insensitive."""
-        task1 = MagicMock()
-        task1.__class__.__name__ = "PasPageTask"
-        task2 = MagicMock()
-        task2.__class__.__name__ = "StatsTask"
-
-        mock_container = MagicMock()
-        mock_container.all_tasks.return_value = [task1, task2]
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
-
-        with patch('notion_task_runner.cli.TaskRunner'), patch('notion_task_runner.cli.asyncio.run'):
-            runner = CliRunner()
-            # Test uppercase filter
-            result = runner.invoke(app, ["run", "--task", "PAS"])
-            assert result.exit_code in [0, 1]  # Should not fail on argument parsing
-
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_error_handling_robustness(self, mock_container_class):
+        task1 = type("PasPageTask", (), {})()
+        task2 = type("StatsTask", (), {})()
+
+        patched_container.return_value = container_factory(tasks=[task1, task2])
+
+        # Test uppercase filter
+        result = cli_runner.invoke(app, ["run", "--task", "PAS"])
+        assert result.exit_code in [0, 1]  # Should not fail on argument parsing
+
+    def test_error_handling_robustness(self, patched_container, cli_runner):
         """Test that CLI handles various error scenarios gracefully."""
         # Mock container to raise an exception to simulate config errors
-        mock_container_class.side_effect = Exception("Configuration error")
-
-        runner = CliRunner()
+        patched_container.side_effect = Exception("Configuration error")
 
         # Test with missing required config (should fail gracefully)
-        result = runner.invoke(app, ["run"])
+        result = cli_runner.invoke(app, ["run"])
         assert result.exit_code == 1  # Should fail gracefully with exit code 1
 
         # Test with task filter and missing config
-        result = runner.invoke(app, ["run", "--task", "pas"])
+        result = cli_runner.invoke(app, ["run", "--task", "pas"])
         assert result.exit_code == 1  # Should fail gracefully with exit code 1
 
-    @patch('notion_task_runner.cli.ApplicationContainer')
-    def test_progress_indicators(self, mock_container_class):
+    def test_progress_indicators(self, no_event_loop, ready_container, cli_runner):
         """Test that progress indicators work correctly."""
-        mock_container = MagicMock()
-        mock_container.all_tasks.return_value = [MagicMock()]
-        mock_config = MagicMock()
-        mock_config.validate_notion_connectivity.return_value = True
-        mock_container.task_config.return_value = mock_config
-        mock_container_class.return_value = mock_container
+        result = cli_runner.invoke(app, ["run"])
 
-        with patch('notion_task_runner.cli.Progress'), patch('notion_task_runner.cli.TaskRunner'), patch('notion_task_runner.cli.asyncio.run'):
-            runner = CliRunner()
-            result = runner.invoke(app, ["run"])
-
-            # Progress indicators should be available
-            assert result.exit_code in [0, 1]  # Allow for config errors
+        # Progress indicators should be available
+        assert result.exit_code in [0, 1]  # Allow for config errors
 
 
 # Helper functions
+def _exit_before_work():
+    """Stand-in container constructor that stops the command once parsing succeeded."""
+    raise SystemExit(0)
+
+
 def strip_ansi(text: str) -> str:
     """Strip ANSI color codes from text."""
     ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
     return ansi_escape.sub('', text)
+
+
+def assert_contains_all(text: str, needles) -> None:
+    """Assert that every needle occurs in text, ignoring case."""
+    lowered = text.lower()
+    missing = [needle for needle in needles if needle.lower() not in lowered]
+    assert not missing, missing
+
+
+@cache
+def _option_names(command: str | None = None) -> frozenset[str]:
+    """Return the flags of the app callback, or of one of its subcommands."""
+    click_command = get_command(app)
+    if command is not None:
+        click_command = click_command.commands[command]
+    return frozenset(opt for param in click_command.params for opt in param.opts)
@@ -3,54 +3,78 @@ Final strategic tests to push coverage over 80%.
 
 These tests target the easiest wins to improve overall coverage.
 """
+import importlib
+import os
+import sys
+from collections.abc import Mapping
 from unittest.mock import MagicMock
 
 import pytest
 
 
-class TestBasicImports:
-    """Test basic module imports to improve coverage."""
+# TaskConfig() only validates when every required variable is set
+_HAS_TASK_CONFIG_ENV = all(os.getenv(name) for name in (
+    "NOTION_SPACE_ID",
+    "NOTION_TOKEN_V2",
+    "NOTION_API_KEY",
+    "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON",
+    "GOOGLE_DRIVE_ROOT_FOLDER_ID",
+))
+
+IMPORTED_MODULES = (
+    "notion_task_runner",
+    "notion_task_runner.cli",
+    "notion_task_runner.constants",
+    "notion_task_runner.container",
+    "notion_task_runner.logging",
+    "notion_task_runner.task_runner",
+    "notion_task_runner.notion",
+    "notion_task_runner.notion.async_notion_client",
+    "notion_task_runner.tasks.task_config",
+)
+
+PUBLIC_SYMBOLS = (
+    "notion_task_runner.cli:app",
+    "notion_task_runner.cli:console",
+    "notion_task_runner.cli:main",
+    "notion_task_runner.cli:version_callback",
+    "notion_task_runner.container:ApplicationContainer",
+    "notion_task_runner.logging:configure_logging",
+    "notion_task_runner.logging:get_logger",
+    "notion_task_runner.constants:get_notion_internal_headers",
+)
+
+
+@pytest.fixture(scope="session")
+def imported_pkg_tree():
+    """Import every module under test once per session."""
+    return [importlib.import_module(name) for name in IMPORTED_MODULES]
+
+
+@pytest.fixture(scope="session")
+def sample_headers():
+    """Build the internal headers for a test user once per session."""
+    from notion_task_runner.constants import get_notion_internal_headers
+
+    return get_notion_internal_headers("test")
 
-    def test_all_modules_importable(self):
-        """Test that all main modules can be imported."""
-        # These imports should work and improve coverage
-        import notion_task_runner
-        import notion_task_runner.cli
-        import notion_task_runner.constants
-        import notion_task_runner.container
-        import notion_task_runner.logging
-        import notion_task_runner.task_runner
-
-        assert notion_task_runner is not None
-        assert notion_task_runner.cli is not None
-        assert notion_task_runner.logging is not None
-        assert notion_task_runner.constants is not None
-
-    def test_notion_modules_importable(self):
-        """Test that notion modules can be imported."""
-        from notion_task_runner.notion import NotionDatabase
-        from notion_task_runner.notion.async_notion_client import AsyncNotionClient
 
-        assert NotionDatabase is not None
-        assert AsyncNotionClient is not None
-
-    def test_task_modules_importable(self):
-        """Test that task modules can be imported."""
-        from notion_task_runner.tasks.task_config import TaskConfig
+class TestBasicImports:
+    """Test basic module imports to improve coverage."""
 
-        assert TaskConfig is not None
+    @pytest.mark.parametrize("modname", IMPORTED_MODULES)
+    def test_importable(self, modname, imported_pkg_tree):
+        """Test that the module can be imported."""
+        assert sys.modules[modname] is not None
 
 
 class TestBasicFunctionality:
     """Test basic functionality of core modules."""
 
-    def test_constants_functions(self):
+    def test_constants_functions(self, sample_headers):
         """Test constants module functions."""
-        from notion_task_runner.constants import get_notion_internal_headers
-
-        headers = get_notion_internal_headers("test_user")
-        assert isinstance(headers, dict)
-        assert len(headers) > 0
+        assert isinstance(sample_headers, Mapping)
+        assert len(sample_headers) > 0
 
     def test_logging_functions(self):
         """Test logging module functions."""
@@ -59,28 +83,16 @@ class TestBasicFunctionality:
         logger = get_logger("test")
         assert logger is not None
 
-    def test_container_class_exists(self):
-        """Test container class exists."""
-        from notion_task_runner.container import ApplicationContainer
-
-        assert ApplicationContainer is not None
-        assert isinstance(ApplicationContainer, type)
-
 
 class TestErrorHandling:
     """Test basic error handling scenarios."""
 
+    @pytest.mark.skipif(not _HAS_TASK_CONFIG_ENV, reason="TaskConfig requires environment setup")
     def test_task_config_basic_creation(self):
         """Test TaskConfig can be created."""
         from notion_task_runner.tasks.task_config import TaskConfig
 
-        # Should be able to create instance
-        try:
-            config = TaskConfig()
-            assert config is not None
-        except Exception:
-            # May require environment variables
-            pytest.skip("TaskConfig requires environment setup")
+        assert TaskConfig() is not None
 
     def test_async_notion_client_class_methods(self):
         """Test AsyncNotionClient has expected class methods."""
@@ -96,21 +108,13 @@ class TestUtilityFunctions:
 
     def test_utils_module_basic(self):
         """Test basic utils module functionality."""
-        try:
-            import notion_task_runner.utils
-            # Just importing the module helps coverage
-            assert notion_task_runner.utils is not None
-        except ImportError:
-            pytest.skip("Utils module not available")
+        module = pytest.importorskip("notion_task_runner.utils")
+        assert module is not None
 
     def test_task_base_functionality(self):
         """Test task base functionality."""
-        try:
-            import notion_task_runner.task
-            # Basic import test
-            assert notion_task_runner.task is not None
-        except ImportError:
-            pytest.skip("Task module not available")
+        module = pytest.importorskip("notion_task_runner.task")
+        assert module is not None
 
 
 class TestSpecificCoverageTargets:
@@ -124,13 +128,6 @@ class TestSpecificCoverageTargets:
         result = version_callback(False)
         assert result is None
 
-    def test_cli_main_function_coverage(self):
-        """Test CLI main function."""
-        from notion_task_runner.cli import main
-
-        # Should be callable
-        assert callable(main)
-
     def test_async_notion_client_config_validation(self):
         """Test AsyncNotionClient config validation edge cases."""
         from notion_task_runner.notion.async_notion_client import AsyncNotionClient
@@ -168,28 +165,12 @@ class TestSpecificCoverageTargets:
 class TestModuleConstants:
     """Test module constants and attributes."""
 
-    def test_cli_app_attributes(self):
-        """Test CLI app has required attributes."""
-        from notion_task_runner.cli import app, console
+    @pytest.mark.parametrize("dotted", PUBLIC_SYMBOLS)
+    def test_symbol_exists(self, dotted):
+        """Test that the module exposes the symbol."""
+        modname, name = dotted.split(":")
+        assert getattr(importlib.import_module(modname), name) is not None
 
-        assert app is not None
-        assert console is not None
-        assert hasattr(app, 'info')
-
-    def test_logging_module_attributes(self):
-        """Test logging module has required functions."""
-        from notion_task_runner.logging import configure_logging, get_logger
-
-        assert callable(configure_logging)
-        assert callable(get_logger)
-
-    def test_constants_module_attributes(self):
+    def test_constants_module_attributes(self, sample_headers):
         """Test constants module has required functions."""
-        from notion_task_runner.constants import get_notion_internal_headers
-
-        assert callable(get_notion_internal_headers)
-
-        # Test that it returns expected structure
-        headers = get_notion_internal_headers("test")
-        assert "x-notion-active-user-header" in headers
-        assert headers["x-notion-active-user-header"] == "test"
+        assert sample_headers["x-notion-active-user-header"] == "test"
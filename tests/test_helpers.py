@@ -5,19 +5,29 @@ This module contains common test helpers that are used across multiple test file
 """
 
 from contextlib import contextmanager
-from unittest.mock import MagicMock, patch
+from copy import copy
+from functools import lru_cache
+from types import SimpleNamespace
+
+import aiohttp
 
-from notion_task_runner.notion.async_notion_client import AsyncNotionClient
 from tests.conftest import TEST_API_KEY, TEST_SPACE_ID
 
+_DEFAULT_CONFIG = SimpleNamespace(
+    notion_api_key=TEST_API_KEY,
+    notion_space_id=TEST_SPACE_ID,
+    validate_notion_connectivity=lambda: True,
+)
+
 
 @contextmanager
 def mock_notion_client_creation(config=None):
     """
     Context manager for creating mock AsyncNotionClient instances.
 
-    This helper reduces the boilerplate of patching the AsyncNotionClient
-    constructor and validation in tests.
+    The client is built with object.__new__, so neither the singleton
+    constructor nor config validation runs and nothing needs patching.
+    Tests that can take fixtures should prefer bare_notion_client.
 
     Args:
         config: Optional config to use. If None, creates a default mock config.
@@ -25,34 +35,34 @@ def mock_notion_client_creation(config=None):
     Yields:
         AsyncNotionClient: A mock client instance
     """
-    if config is None:
-        config = MagicMock()
-        config.notion_api_key = TEST_API_KEY
-        config.notion_space_id = TEST_SPACE_ID
+    from notion_task_runner.notion.async_notion_client import AsyncNotionClient
 
-    with (patch.object(AsyncNotionClient, '__new__', return_value=object.__new__(AsyncNotionClient)),
-          patch.object(AsyncNotionClient, '_validate_config')):
-        client = AsyncNotionClient(config)
-        client.config = config
-        yield client
+    client = object.__new__(AsyncNotionClient)
+    client.config = config if config is not None else create_mock_config()
+    client._session = None
+    client._connector = None
+    yield client
 
 
+@lru_cache(maxsize=32)
 def create_mock_database_rows(count: int = 2, column_name: str = "Slutpris", base_value: int = 10):
     """
     Create mock database rows for testing.
 
+    Results are cached per argument set, so callers share one immutable tuple.
+
     Args:
         count: Number of rows to create
         column_name: Name of the column containing numeric values
         base_value: Base value for calculations (rows will have base_value * index)
 
     Returns:
-        List of mock database row dictionaries
+        Tuple of mock database row dictionaries
     """
-    return [
+    return tuple(
         {"properties": {column_name: {"number": base_value * (i + 1)}}}
         for i in range(count)
-    ]
+    )
 
 
 def create_mock_config(**overrides):
@@ -63,15 +73,54 @@ def create_mock_config(**overrides):
         **overrides: Any config attributes to override
 
     Returns:
-        MagicMock: A mock config object
+        SimpleNamespace: A plain config object
     """
-    config = MagicMock()
-    config.notion_api_key = TEST_API_KEY
-    config.notion_space_id = TEST_SPACE_ID
-    config.validate_notion_connectivity.return_value = True
-
-    # Apply any overrides
-    for key, value in overrides.items():
-        setattr(config, key, value)
+    config = copy(_DEFAULT_CONFIG)
+    config.__dict__.update(overrides)
 
     return config
+
+
+@lru_cache(maxsize=8)
+def client_response_error(status: int, message: str = "") -> aiohttp.ClientResponseError:
+    """
+    Return a cached aiohttp ClientResponseError for the given status.
+
+    aiohttp only reads request_info when formatting the error, so a small
+    namespace stands in for a real RequestInfo.
+
+    Args:
+        status: HTTP status code of the error
+        message: Error message. Defaults to "HTTP <status>"
+
+    Returns:
+        aiohttp.ClientResponseError: The shared error instance for these arguments
+    """
+    return aiohttp.ClientResponseError(
+        request_info=SimpleNamespace(real_url="https://api.notion.com", method="PATCH", headers={}),
+        history=(),
+        status=status,
+        message=message or f"HTTP {status}",
+    )
+
+
+def logged_messages(caplog, level: int, logger: str = "notion_task_runner.tasks.base_page_task") -> list[str]:
+    """
+    Return the messages one logger emitted at exactly the given level.
+
+    Reads caplog.records directly instead of building the joined caplog.text,
+    and ignores records from unrelated loggers.
+
+    Args:
+        caplog: The pytest caplog fixture
+        level: Logging level the records must have
+        logger: Name of the logger that emitted the records
+
+    Returns:
+        List of rendered log messages
+    """
+    return [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == logger and record.levelno == level
+    ]
@@ -5,31 +5,73 @@ These tests verify that the complete system works together properly,
 including configuration, client setup, and task execution.
 """
 
-import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
+import pytest_asyncio
+import responses
 
+from notion_task_runner.constants import NOTION_BASE_URL
 from notion_task_runner.notion import NotionDatabase
 from notion_task_runner.notion.async_notion_client import AsyncNotionClient
 from notion_task_runner.task_runner import TaskRunner
 from notion_task_runner.tasks.task_config import TaskConfig
+from tests.conftest import FakeConfig
+
+INTEGRATION_ENV: Mapping[str, str] = MappingProxyType({
+    "IS_PROD": "false",
+    "NOTION_SPACE_ID": "test-space-id",
+    "NOTION_TOKEN_V2": "test-token-v2",
+    "NOTION_API_KEY": "test-api-key",
+    "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
+    "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
+})
+USERS_ME_URL = f"{NOTION_BASE_URL}/users/me"
+
+
+@pytest.fixture(scope="class")
+def env_config(tmp_path_factory):
+    """Load TaskConfig from the integration environment once per test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Class-scoped, so the function-scoped _no_dotenv fixture has not run yet
+        mp.setitem(TaskConfig.model_config, "env_file", None)
+        for key, value in INTEGRATION_ENV.items():
+            mp.setenv(key, value)
+        mp.setenv("DOWNLOADS_DIRECTORY_PATH", str(tmp_path_factory.mktemp("exports")))
+        yield TaskConfig.from_env()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_async_singleton():
+    """Start every test from a fresh AsyncNotionClient singleton."""
+    await AsyncNotionClient.reset_singleton()
+    yield
+
+
+@pytest.fixture
+def mock_aiohttp():
+    """Patch aiohttp.ClientSession and return the session it hands out."""
+    with patch('aiohttp.ClientSession') as session_class:
+        session_class.return_value = Mock()
+        yield session_class.return_value
+
+
+@pytest.fixture
+def notion_users_me():
+    """Answer the connectivity check with a 200; tests may replace the response."""
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, USERS_ME_URL, status=200)
+        yield rsps
 
 
 class TestIntegration:
     """Integration tests for the full task runner system."""
 
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    def test_task_config_from_env_success(self):
+    def test_task_config_from_env_success(self, env_config):
         """Test that TaskConfig can be loaded from environment variables."""
-        config = TaskConfig.from_env()
+        config = env_config
 
         assert config.is_prod is False
         assert config.notion_space_id == "test-space-id"
@@ -38,102 +80,35 @@ class TestIntegration:
         assert config.google_drive_service_account_secret_json == "test-service-account"
         assert config.google_drive_root_folder_id == "test-folder-id"
 
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    @patch('requests.get')
-    def test_task_config_validate_connectivity_success(self, mock_get):
+    def test_task_config_validate_connectivity_success(self, notion_users_me, env_config):
         """Test that notion connectivity validation works."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-
-        config = TaskConfig.from_env()
+        config = env_config
         assert config.validate_notion_connectivity() is True
 
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    @patch('requests.get')
-    def test_task_config_validate_connectivity_failure(self, mock_get):
+    def test_task_config_validate_connectivity_failure(self, notion_users_me, env_config):
         """Test that notion connectivity validation handles failures."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
+        notion_users_me.replace(responses.GET, USERS_ME_URL, status=401)
 
-        config = TaskConfig.from_env()
+        config = env_config
         assert config.validate_notion_connectivity() is False
 
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    @patch('aiohttp.ClientSession')
-    @pytest.mark.asyncio
-    async def test_async_notion_client_initialization(self, mock_session_class):
+    async def test_async_notion_client_initialization(self, mock_aiohttp, env_config):
         """Test that AsyncNotionClient can be initialized with config."""
-        # Reset singleton before test
-        await AsyncNotionClient.reset_singleton()
-
-        mock_session = Mock()
-        mock_session_class.return_value = mock_session
-
-        config = TaskConfig.from_env()
+        config = env_config
         client = AsyncNotionClient(config)
 
         assert client.config == config
 
     def test_task_runner_initialization_validation_failure(self):
         """Test that TaskRunner fails if Notion validation fails."""
-        mock_config = Mock()
-        mock_config.validate_notion_connectivity.return_value = False
-        mock_config.is_prod = False
-
         tasks = []  # Empty task list for testing
 
         with pytest.raises(RuntimeError, match="Notion API validation failed"):
-            TaskRunner(tasks=tasks, config=mock_config)
-
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    @patch('requests.get')
-    @patch('aiohttp.ClientSession')
-    @pytest.mark.asyncio
-    async def test_notion_database_initialization(self, mock_session_class, mock_get):
-        """Test that NotionDatabase can be initialized."""
-        # Reset singleton before test
-        await AsyncNotionClient.reset_singleton()
+            TaskRunner(tasks=tasks, config=FakeConfig(connected=False))
 
-        # Mock connectivity validation
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-
-        # Mock client session
-        mock_session = Mock()
-        mock_session_class.return_value = mock_session
-
-        config = TaskConfig.from_env()
+    async def test_notion_database_initialization(self, mock_aiohttp, env_config):
+        """Test that NotionDatabase can be initialized."""
+        config = env_config
         client = AsyncNotionClient(config)
         database = NotionDatabase(client, config)
 
@@ -142,25 +117,9 @@ class TestIntegration:
         assert database.max_retries == 3
         assert database.retry_wait_seconds == 2
 
-    @patch.dict(os.environ, {
-        "IS_PROD": "false",
-        "NOTION_SPACE_ID": "test-space-id",
-        "NOTION_TOKEN_V2": "test-token-v2",
-        "NOTION_API_KEY": "test-api-key",
-        "GOOGLE_DRIVE_SERVICE_ACCOUNT_SECRET_JSON": "test-service-account",
-        "GOOGLE_DRIVE_ROOT_FOLDER_ID": "test-folder-id",
-    })
-    @patch('aiohttp.ClientSession')
-    @pytest.mark.asyncio
-    async def test_async_notion_client_singleton_behavior(self, mock_session_class):
+    async def test_async_notion_client_singleton_behavior(self, mock_aiohttp, env_config):
         """Test that AsyncNotionClient behaves as a singleton."""
-        # Reset singleton before test
-        await AsyncNotionClient.reset_singleton()
-
-        mock_session = Mock()
-        mock_session_class.return_value = mock_session
-
-        config = TaskConfig.from_env()
+        config = env_config
 
         # Create first instance
         client1 = AsyncNotionClient(config)
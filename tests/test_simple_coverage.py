@@ -1,42 +1,44 @@
 """
 Simple tests for quick coverage wins.
 """
+from collections.abc import Mapping
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+pytestmark = pytest.mark.coverage_only
+
 
 class TestSimpleCoverage:
     """Simple tests to bump coverage."""
 
     def test_task_module_coverage(self):
         """Test task module basic functionality."""
-        try:
-            import notion_task_runner.task
-            # Just importing helps coverage
-            assert notion_task_runner.task is not None
-        except ImportError:
-            pytest.skip("Task module not available")
+        module = pytest.importorskip("notion_task_runner.task")
+        assert module is not None
 
     def test_utils_module_coverage(self):
         """Test utils module basic functionality."""
-        try:
-            import notion_task_runner.utils
-            # Just importing helps coverage
-            assert notion_task_runner.utils is not None
-        except ImportError:
-            pytest.skip("Utils module not available")
+        module = pytest.importorskip("notion_task_runner.utils")
+        assert module is not None
 
     def test_car_model_coverage(self):
         """Test car model basic functionality."""
-        try:
-            from notion_task_runner.tasks.car.car_model import CarModel
-            # Test basic instantiation
-            model = CarModel()
-            assert model is not None
-        except Exception:
-            # May require specific initialization
-            pytest.skip("CarModel requires specific initialization")
+        car_model = pytest.importorskip("notion_task_runner.tasks.car.car_model")
+
+        car = car_model.Car(
+            reg_number="ABC123",
+            model="Volvo V70",
+            model_year=2010,
+            color="Silver",
+            inspected_at="2025-01-01",
+            next_inspection_latest_at="2026-01-01",
+            tax_yearly_sek=1500,
+            registered_at="2010-05-01",
+            mileage_km=250000,
+            horsepower=140,
+        )
+        assert "ABC123" in str(car)
 
     def test_async_notion_client_singleton_coverage(self):
         """Test AsyncNotionClient singleton behavior."""
@@ -74,9 +76,9 @@ class TestSimpleCoverage:
         headers2 = get_notion_internal_headers("user2")
         headers3 = get_notion_internal_headers("")
 
-        assert isinstance(headers1, dict)
-        assert isinstance(headers2, dict)
-        assert isinstance(headers3, dict)
+        assert isinstance(headers1, Mapping)
+        assert isinstance(headers2, Mapping)
+        assert isinstance(headers3, Mapping)
 
         # Test specific headers exist
         assert "x-notion-active-user-header" in headers1
@@ -102,67 +104,34 @@ class TestSimpleCoverage:
 
     def test_audiophile_task_coverage(self):
         """Test audiophile task basic coverage."""
-        try:
-            from notion_task_runner.tasks.audiophile.audiophile_page_task import (
-                AudiophilePageTask,
-            )
-            # Test class exists
-            assert AudiophilePageTask is not None
-        except ImportError:
-            pytest.skip("AudiophilePageTask not available")
+        module = pytest.importorskip("notion_task_runner.tasks.audiophile.audiophile_page_task")
+        assert module.AudiophilePageTask is not None
 
     def test_backup_modules_coverage(self):
         """Test backup modules basic coverage."""
-        try:
-            from notion_task_runner.tasks.backup.export_file_watcher import (
-                ExportFileWatcher,
-            )
-            from notion_task_runner.tasks.backup.google_drive_client import (
-                GoogleDriveClient,
-            )
-
-            # Test classes exist
-            assert ExportFileWatcher is not None
-            assert GoogleDriveClient is not None
-        except ImportError:
-            pytest.skip("Backup modules not available")
+        watcher = pytest.importorskip("notion_task_runner.tasks.backup.export_file_watcher")
+        drive = pytest.importorskip("notion_task_runner.tasks.backup.google_drive_client")
+
+        assert watcher.ExportFileWatcher is not None
+        assert drive.GoogleDriveClient is not None
 
     def test_download_export_modules_coverage(self):
         """Test download export modules basic coverage."""
-        try:
-            from notion_task_runner.tasks.download_export.export_file_downloader import (
-                ExportFileDownloader,
-            )
-            from notion_task_runner.tasks.download_export.export_file_poller import (
-                ExportFilePoller,
-            )
-
-            # Test classes exist
-            assert ExportFileDownloader is not None
-            assert ExportFilePoller is not None
-        except ImportError:
-            pytest.skip("Download export modules not available")
+        downloader = pytest.importorskip("notion_task_runner.tasks.download_export.export_file_downloader")
+        poller = pytest.importorskip("notion_task_runner.tasks.download_export.export_file_poller")
+
+        assert downloader.ExportFileDownloader is not None
+        assert poller.ExportFilePoller is not None
 
     def test_pas_modules_coverage(self):
         """Test PAS modules coverage."""
-        try:
-            from notion_task_runner.tasks.pas.pas_page_task import PasPageTask
-            from notion_task_runner.tasks.pas.sum_calculator import SumCalculator
+        pas_page_task = pytest.importorskip("notion_task_runner.tasks.pas.pas_page_task")
+        sum_calculator = pytest.importorskip("notion_task_runner.tasks.pas.sum_calculator")
 
-            # Test classes exist
-            assert PasPageTask is not None
-            assert SumCalculator is not None
-        except ImportError:
-            pytest.skip("PAS modules not available")
+        assert pas_page_task.PASPageTask is not None
+        assert sum_calculator.SumCalculator is not None
 
     def test_prylarkiv_modules_coverage(self):
         """Test Prylarkiv modules coverage."""
-        try:
-            from notion_task_runner.tasks.prylarkiv.prylarkiv_page_task import (
-                PrylarkivPageTask,
-            )
-
-            # Test class exists
-            assert PrylarkivPageTask is not None
-        except ImportError:
-            pytest.skip("Prylarkiv modules not available")
+        module = pytest.importorskip("notion_task_runner.tasks.prylarkiv.prylarkiv_page_task")
+        assert module.PrylarkivPageTask is not None
@@ -5,43 +5,86 @@ Tests task filtering, error handling, validation, and edge cases
 that aren't covered by the existing test_task_runner.py.
 """
 import asyncio
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
-from notion_task_runner.logging import configure_logging
 from notion_task_runner.task_runner import TaskRunner
 from notion_task_runner.tasks.task_config import TaskConfig
+from tests.test_helpers import logged_messages
 
-# Configure logging for tests
-configure_logging(json_logs=False, log_level="DEBUG")
+_RUNNER_LOGGER = "notion_task_runner.task_runner"
+TASK_FAILED = Exception("Task failed")
+TASK_TIMEOUT = asyncio.TimeoutError("Task timed out")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session", autouse=True)
+async def _eager_tasks():
+    """Let gathered coroutines that never suspend finish inline (Python 3.12+)."""
+    if not hasattr(asyncio, "eager_task_factory"):
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(previous)
+
+
+@pytest.fixture(scope="module")
+def _spec_config():
+    """Build the spec'd config mock once; mock_config resets it for each test."""
+    return MagicMock(spec=TaskConfig)
 
 
 @pytest.fixture
-def mock_config():
+def mock_config(_spec_config):
     """Create a mock config."""
-    config = MagicMock(spec=TaskConfig)
-    config.validate_notion_connectivity.return_value = True
-    config.is_prod = False
-    return config
+    _spec_config.reset_mock(return_value=True, side_effect=True)
+    _spec_config.validate_notion_connectivity.return_value = True
+    _spec_config.is_prod = False
+    return _spec_config
+
+
+class StubTask:
+    """Async task double that counts runs and raises ``exc`` when set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.exc = None
+
+    async def run(self):
+        self.calls += 1
+        if self.exc is not None:
+            raise self.exc
+
+
+# TaskRunner and the filter tests go by class name, so each stub gets its own subclass
+_STUB_TYPES = tuple(type(name, (StubTask,), {}) for name in ("PasPageTask", "StatsTask", "ExportFileTask"))
+
+
+def _named_task(name, **run_kwargs):
+    """Create an instance of a class called ``name`` whose run is an AsyncMock."""
+    task = type(name, (), {})()
+    task.run = AsyncMock(**run_kwargs)
+    return task
 
 
 @pytest.fixture
 def mock_tasks():
-    """Create mock tasks with different characteristics."""
-    task1 = MagicMock()
-    task1.__class__.__name__ = "PasPageTask"
-    task1.run = AsyncMock()
-
-    task2 = MagicMock()
-    task2.__class__.__name__ = "StatsTask"
-    task2.run = AsyncMock()
+    """Create stub tasks with different characteristics."""
+    return [stub_type() for stub_type in _STUB_TYPES]
 
-    task3 = MagicMock()
-    task3.__class__.__name__ = "ExportFileTask"
-    task3.run = AsyncMock()
 
-    return [task1, task2, task3]
+@pytest.fixture(scope="class")
+def shared_runner(_spec_config):
+    """Create one runner per class for tests that only read its state."""
+    _spec_config.validate_notion_connectivity.return_value = True
+    _spec_config.is_prod = False
+    return TaskRunner(tasks=[stub_type() for stub_type in _STUB_TYPES], config=_spec_config)
 
 
 class TestTaskRunnerInitialization:
@@ -78,7 +121,6 @@ class TestTaskRunnerInitialization:
 class TestTaskFiltering:
     """Test task filtering functionality."""
 
-    @pytest.mark.asyncio
     async def test_run_all_tasks_without_filter(self, mock_tasks, mock_config):
         """Test running all tasks when no filter is applied."""
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
@@ -86,112 +128,76 @@ class TestTaskFiltering:
         await runner.run_async()
 
         # All tasks should be executed
-        for task in mock_tasks:
-            task.run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_run_with_task_filter_matching(self, mock_tasks, mock_config):
-        """Test running tasks with filter that matches some tasks."""
-        # Filter tasks manually (as TaskRunner doesn't support filtering internally)
-        filtered_tasks = [task for task in mock_tasks if "pas" in task.__class__.__name__.lower()]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # Only PAS task should be in the filtered list
-        assert len(filtered_tasks) == 1
-        filtered_tasks[0].run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_run_with_task_filter_case_insensitive(self, mock_tasks, mock_config):
-        """Test that task filtering is case insensitive."""
-        # Filter tasks manually with case insensitive matching
-        filtered_tasks = [task for task in mock_tasks if "STATS".lower() in task.__class__.__name__.lower()]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # StatsTask should be in the filtered list
-        assert len(filtered_tasks) == 1
-        assert filtered_tasks[0].__class__.__name__ == "StatsTask"
-        filtered_tasks[0].run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_run_with_task_filter_no_matches(self, mock_tasks, mock_config):
-        """Test running with filter that matches no tasks."""
-        # Filter tasks manually with no matches
-        filtered_tasks = [task for task in mock_tasks if "nonexistent" in task.__class__.__name__.lower()]
+        assert all(task.calls == 1 for task in mock_tasks)
+
+    @pytest.mark.parametrize("filter_str,expected", [
+        ("pas", ["PasPageTask"]),
+        ("STATS", ["StatsTask"]),
+        ("nonexistent", []),
+        ("Task", ["PasPageTask", "StatsTask", "ExportFileTask"]),
+        ("", ["PasPageTask", "StatsTask", "ExportFileTask"]),
+        ("   ", ["PasPageTask", "StatsTask", "ExportFileTask"]),
+        ("!@#$%^&*()", []),
+        ("🚀📊💾", []),
+    ], ids=["matching", "case_insensitive", "no_matches", "partial_name", "empty", "whitespace_only",
+            "special_characters", "unicode"])
+    async def test_run_with_task_filter(self, mock_tasks, mock_config, filter_str, expected):
+        """Test that only tasks matching the filter are handed to the runner and run."""
+        # Filter tasks manually (as TaskRunner doesn't support filtering internally).
+        # Blank filters are treated as empty and include all tasks.
+        needle = filter_str.strip().lower()
+        filtered_tasks = [task for task in mock_tasks if needle in task.__class__.__name__.lower()]
         runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
 
         await runner.run_async()
 
-        # No tasks should be in the filtered list
-        assert len(filtered_tasks) == 0
-
-    @pytest.mark.asyncio
-    async def test_run_with_partial_name_filter(self, mock_tasks, mock_config):
-        """Test filtering with partial task name."""
-        # Filter tasks manually for "Task" which should match all
-        filtered_tasks = [task for task in mock_tasks if "Task" in task.__class__.__name__]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # All tasks should be in the filtered list as they all contain "Task"
-        assert len(filtered_tasks) == 3
-        for task in filtered_tasks:
-            task.run.assert_called_once()
+        assert [task.__class__.__name__ for task in filtered_tasks] == expected
+        assert [task.calls for task in mock_tasks] == [int(task in filtered_tasks) for task in mock_tasks]
 
 
 class TestErrorHandling:
     """Test error handling in task execution."""
 
-    @pytest.mark.asyncio
     async def test_single_task_failure_continues_execution(self, mock_tasks, mock_config):
         """Test that single task failure doesn't stop other tasks."""
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
 
         # Make first task fail
-        mock_tasks[0].run.side_effect = Exception("Task 1 failed")
+        mock_tasks[0].exc = TASK_FAILED
 
         # Should not raise exception
         await runner.run_async()
 
         # Failed task should still be called
-        mock_tasks[0].run.assert_called_once()
+        assert mock_tasks[0].calls == 1
         # Other tasks should continue running
-        mock_tasks[1].run.assert_called_once()
-        mock_tasks[2].run.assert_called_once()
+        assert mock_tasks[1].calls == 1
+        assert mock_tasks[2].calls == 1
 
-    @pytest.mark.asyncio
     async def test_multiple_task_failures(self, mock_tasks, mock_config):
         """Test handling of multiple task failures."""
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
 
         # Make multiple tasks fail
-        mock_tasks[0].run.side_effect = Exception("Task 1 failed")
-        mock_tasks[2].run.side_effect = Exception("Task 3 failed")
+        mock_tasks[0].exc = TASK_FAILED
+        mock_tasks[2].exc = TASK_FAILED
 
         # Should not raise exception
         await runner.run_async()
 
         # All tasks should be attempted
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        assert all(task.calls == 1 for task in mock_tasks)
 
-    @pytest.mark.asyncio
     async def test_asyncio_error_handling(self, mock_tasks, mock_config):
         """Test handling of asyncio-specific errors."""
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
 
         # Make task fail with asyncio error
-        mock_tasks[0].run.side_effect = asyncio.TimeoutError("Task timed out")
+        mock_tasks[0].exc = TASK_TIMEOUT
 
         await runner.run_async()
 
-        mock_tasks[0].run.assert_called_once()
-        mock_tasks[1].run.assert_called_once()
-        mock_tasks[2].run.assert_called_once()
+        assert all(task.calls == 1 for task in mock_tasks)
 
     # Keyboard interrupt test removed due to hanging issues in test environment
 
@@ -268,7 +274,6 @@ class TestConfigurationValidation:
 class TestProductionMode:
     """Test production mode behavior."""
 
-    @pytest.mark.asyncio
     async def test_production_mode_enabled(self, mock_tasks, mock_config):
         """Test behavior in production mode."""
         mock_config.is_prod = True
@@ -277,10 +282,8 @@ class TestProductionMode:
         await runner.run_async()
 
         # All tasks should still run in production
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        assert all(task.calls == 1 for task in mock_tasks)
 
-    @pytest.mark.asyncio
     async def test_development_mode(self, mock_tasks, mock_config):
         """Test behavior in development mode."""
         mock_config.is_prod = False
@@ -289,8 +292,7 @@ class TestProductionMode:
         await runner.run_async()
 
         # All tasks should run in development
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        assert all(task.calls == 1 for task in mock_tasks)
 
     @patch('notion_task_runner.task_runner.configure_logging')
     @patch('notion_task_runner.task_runner.__name__', '__main__')
@@ -318,75 +320,49 @@ class TestProductionMode:
 class TestLogging:
     """Test logging functionality."""
 
-    @pytest.mark.asyncio
-    async def test_task_execution_runs_successfully(self, mock_tasks, mock_config):
-        """Test that task execution completes without errors."""
+    async def test_failed_task_is_logged_and_others_complete(self, mock_tasks, mock_config, caplog):
+        """Test that a failing task is logged as an error while the rest log completion."""
+        mock_tasks[0].exc = TASK_FAILED
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
 
-        # Should not raise any exception
-        await runner.run_async()
-
-        # All tasks should be executed
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        with caplog.at_level(logging.DEBUG, logger=_RUNNER_LOGGER):
+            await runner.run_async()
 
-    @pytest.mark.asyncio
-    async def test_error_handling_continues_execution(self, mock_tasks, mock_config):
-        """Test that errors are handled gracefully."""
-        runner = TaskRunner(tasks=mock_tasks, config=mock_config)
-
-        # Make a task fail
-        mock_tasks[0].run.side_effect = Exception("Test error")
-
-        # Should not raise exception despite task failure
-        await runner.run_async()
-
-        # All tasks should still be attempted
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        errors = logged_messages(caplog, logging.ERROR, logger=_RUNNER_LOGGER)
+        completed = logged_messages(caplog, logging.DEBUG, logger=_RUNNER_LOGGER)
+        assert len(errors) == 1
+        assert "Task failed" in errors[0] and "PasPageTask" in errors[0]
+        assert sum("Task completed successfully" in m for m in completed) == 2
 
 
 class TestConcurrentExecution:
     """Test concurrent task execution."""
 
-    @pytest.mark.asyncio
     async def test_tasks_run_concurrently(self, mock_config):
         """Test that tasks are executed concurrently."""
-        # Create tasks with delays to test concurrency
-        slow_task1 = MagicMock()
-        slow_task1.__class__.__name__ = "SlowTask1"
-        slow_task1.run = AsyncMock()
-
-        slow_task2 = MagicMock()
-        slow_task2.__class__.__name__ = "SlowTask2"
-        slow_task2.run = AsyncMock()
+        slow_task1 = _named_task("SlowTask1")
+        slow_task2 = _named_task("SlowTask2")
 
         tasks = [slow_task1, slow_task2]
         runner = TaskRunner(tasks=tasks, config=mock_config)
 
-        # Measure execution time
-        import time
-        start_time = time.time()
+        # Measure execution time on the loop's monotonic clock
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         await runner.run_async()
-        execution_time = time.time() - start_time
+        execution_time = loop.time() - start_time
 
-        # Should complete quickly due to concurrency
-        assert execution_time < 1.0  # Should be much faster than sequential execution
+        # The mocked runs return immediately, so anything slow means something blocked
+        assert execution_time < 0.1
 
         # Both tasks should be called
         slow_task1.run.assert_called_once()
         slow_task2.run.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_concurrent_execution_with_failures(self, mock_config):
         """Test concurrent execution when some tasks fail."""
-        failing_task = MagicMock()
-        failing_task.__class__.__name__ = "FailingTask"
-        failing_task.run = AsyncMock(side_effect=Exception("Task failed"))
-
-        success_task = MagicMock()
-        success_task.__class__.__name__ = "SuccessTask"
-        success_task.run = AsyncMock()
+        failing_task = _named_task("FailingTask", side_effect=TASK_FAILED)
+        success_task = _named_task("SuccessTask")
 
         tasks = [failing_task, success_task]
         runner = TaskRunner(tasks=tasks, config=mock_config)
@@ -401,62 +377,6 @@ class TestConcurrentExecution:
 class TestEdgeCases:
     """Test edge cases and unusual scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_empty_task_filter(self, mock_tasks, mock_config):
-        """Test running with empty string filter."""
-        # Empty filter should include all tasks
-        filter_str = ""
-        filtered_tasks = [task for task in mock_tasks if not filter_str or filter_str in task.__class__.__name__.lower()]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # All tasks should run with empty filter
-        assert len(filtered_tasks) == 3
-        for task in filtered_tasks:
-            task.run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_whitespace_only_filter(self, mock_tasks, mock_config):
-        """Test running with whitespace-only filter."""
-        # Whitespace filter should be treated as empty and include all tasks
-        filter_str = "   ".strip()
-        filtered_tasks = [task for task in mock_tasks if not filter_str or filter_str in task.__class__.__name__.lower()]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # All tasks should run with whitespace filter
-        assert len(filtered_tasks) == 3
-        for task in filtered_tasks:
-            task.run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_special_characters_in_filter(self, mock_tasks, mock_config):
-        """Test filtering with special characters."""
-        # Filter tasks manually with special characters
-        filter_str = "!@#$%^&*()"
-        filtered_tasks = [task for task in mock_tasks if filter_str in task.__class__.__name__]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # No tasks should match special characters
-        assert len(filtered_tasks) == 0
-
-    @pytest.mark.asyncio
-    async def test_unicode_filter(self, mock_tasks, mock_config):
-        """Test filtering with unicode characters."""
-        # Filter tasks manually with unicode characters
-        filter_str = "🚀📊💾"
-        filtered_tasks = [task for task in mock_tasks if filter_str in task.__class__.__name__]
-        runner = TaskRunner(tasks=filtered_tasks, config=mock_config)
-
-        await runner.run_async()
-
-        # No tasks should match unicode characters
-        assert len(filtered_tasks) == 0
-
     def test_repr_method(self, mock_tasks, mock_config):
         """Test __repr__ method."""
         runner = TaskRunner(tasks=mock_tasks, config=mock_config)
@@ -481,13 +401,12 @@ class TestSynchronousExecution:
         runner.run()
 
         # All tasks should be executed
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        assert all(task.run.call_count == 1 for task in mock_tasks)
 
     def test_run_method_with_failures(self, mock_tasks, mock_config):
         """Test synchronous run method with task failures."""
         # Make first task fail
-        mock_tasks[0].run = MagicMock(side_effect=Exception("Task 1 failed"))
+        mock_tasks[0].run = MagicMock(side_effect=TASK_FAILED)
         mock_tasks[1].run = MagicMock()
         mock_tasks[2].run = MagicMock()
 
@@ -497,8 +416,7 @@ class TestSynchronousExecution:
         runner.run()
 
         # All tasks should be attempted
-        for task in mock_tasks:
-            task.run.assert_called_once()
+        assert all(task.run.call_count == 1 for task in mock_tasks)
 
     def test_run_method_empty_tasks(self, mock_config):
         """Test synchronous run method with empty tasks list."""
@@ -508,6 +426,7 @@ class TestSynchronousExecution:
         runner.run()
 
 
+@pytest.mark.slow
 class TestFactoryFunction:
     """Test the create_task_runner factory function."""
 
@@ -534,53 +453,13 @@ class TestFactoryFunction:
             assert callable(create_task_runner)
 
 
-class TestMainExecution:
-    """Test main module execution path."""
-
-    @patch('notion_task_runner.task_runner.asyncio.run')
-    @patch('notion_task_runner.task_runner.create_task_runner')
-    @patch('notion_task_runner.task_runner.ApplicationContainer')
-    def test_main_execution_path(self, mock_container_class, mock_create_runner, mock_asyncio_run):
-        """Test the main execution path when run as script."""
-        # Mock container
-        mock_container = MagicMock()
-        mock_container_class.return_value = mock_container
-
-        # Mock task runner
-        mock_runner = MagicMock()
-        mock_create_runner.return_value = mock_runner
-
-        # Import with __name__ == '__main__'
-        import sys
-        original_argv = sys.argv
-        sys.argv = ['task_runner.py']
-
-        try:
-            # This would normally be in the if __name__ == '__main__' block
-            # We can't easily test that directly, but we can test the components
-
-            container = mock_container_class()
-            container.wire(modules=['__main__'])
-            mock_create_runner()
-
-            # Verify container setup
-            mock_container_class.assert_called_once()
-            container.wire.assert_called_once_with(modules=['__main__'])
-            mock_create_runner.assert_called_once()
-
-        finally:
-            sys.argv = original_argv
-
-
 class TestTaskRunnerMethods:
     """Test additional TaskRunner methods."""
 
-    def test_get_task_names(self, mock_tasks, mock_config):
+    def test_get_task_names(self, shared_runner):
         """Test getting task names."""
-        runner = TaskRunner(tasks=mock_tasks, config=mock_config)
-
         # Manually get task names since _get_task_names doesn't exist
-        task_names = [task.__class__.__name__ for task in runner.tasks]
+        task_names = [task.__class__.__name__ for task in shared_runner.tasks]
 
         expected_names = ["PasPageTask", "StatsTask", "ExportFileTask"]
         assert task_names == expected_names
@@ -594,30 +473,24 @@ class TestTaskRunnerMethods:
 
         assert task_names == []
 
-    def test_filter_tasks_by_name(self, mock_tasks, mock_config):
+    def test_filter_tasks_by_name(self, shared_runner):
         """Test filtering tasks by name."""
-        runner = TaskRunner(tasks=mock_tasks, config=mock_config)
-
         # Manually filter tasks by name since _filter_tasks_by_name doesn't exist
-        filtered = [task for task in runner.tasks if "pas" in task.__class__.__name__.lower()]
+        filtered = [task for task in shared_runner.tasks if "pas" in task.__class__.__name__.lower()]
 
         assert len(filtered) == 1
         assert filtered[0].__class__.__name__ == "PasPageTask"
 
-    def test_filter_tasks_by_name_multiple_matches(self, mock_tasks, mock_config):
+    def test_filter_tasks_by_name_multiple_matches(self, shared_runner):
         """Test filtering with multiple matches."""
-        runner = TaskRunner(tasks=mock_tasks, config=mock_config)
-
         # "Task" should match all tasks
-        filtered = [task for task in runner.tasks if "Task" in task.__class__.__name__]
+        filtered = [task for task in shared_runner.tasks if "Task" in task.__class__.__name__]
 
         assert len(filtered) == 3
 
-    def test_filter_tasks_by_name_no_matches(self, mock_tasks, mock_config):
+    def test_filter_tasks_by_name_no_matches(self, shared_runner):
         """Test filtering with no matches."""
-        runner = TaskRunner(tasks=mock_tasks, config=mock_config)
-
         # Manually filter with no matches
-        filtered = [task for task in runner.tasks if "nonexistent" in task.__class__.__name__.lower()]
+        filtered = [task for task in shared_runner.tasks if "nonexistent" in task.__class__.__name__.lower()]
 
         assert len(filtered) == 0